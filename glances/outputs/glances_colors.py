@@ -9,6 +9,7 @@
 """Glances colors."""
 
 import sys
+from types import MappingProxyType
 
 from glances.logger import logger
 
@@ -18,30 +19,117 @@ except ImportError:
     logger.critical("Curses module not found. Glances cannot start in standalone mode.")
     sys.exit(1)
 
+# Resolve the optional curses features once at import time, with a single
+# lookup each (the curses module does not grow new attributes at runtime)
+_start_color = getattr(curses, 'start_color', None)
+_use_default_colors = getattr(curses, 'use_default_colors', None)
+_assume_default_colors = getattr(curses, 'assume_default_colors', None)
+
+# Immutable curses constants, aliased at module level to shorten the
+# curses.<attr> lookup chain at every reference
+_BLACK = curses.COLOR_BLACK
+_RED = curses.COLOR_RED
+_GREEN = curses.COLOR_GREEN
+_BLUE = curses.COLOR_BLUE
+_MAGENTA = curses.COLOR_MAGENTA
+_CYAN = curses.COLOR_CYAN
+_YELLOW = curses.COLOR_YELLOW
+_A_UNDERLINE = curses.A_UNDERLINE
+_A_REVERSE = curses.A_REVERSE
+_A_PROTECT = curses.A_PROTECT
+
 
 class GlancesColors:
     """Class to manage colors in Glances UI
     For the moment limited to Curses interface.
     But will be used in the WebUI through the issue #2048"""
 
+    # No per-instance __dict__: attribute access goes through fixed slots
+    __slots__ = (
+        'args',
+        'A_BOLD',
+        'DEFAULT',
+        'OK_LOG',
+        'NICE',
+        'CPU_TIME',
+        'CAREFUL_LOG',
+        'WARNING_LOG',
+        'CRITICAL_LOG',
+        'OK',
+        'CAREFUL',
+        'WARNING',
+        'CRITICAL',
+        'INFO',
+        'FILTER',
+        'SELECTED',
+        'SEPARATOR',
+        'SORT',
+        'MAX',
+        'PROCESS_SELECTED',
+        '_colors_cache',
+        '_frozen_cache',
+        '_disable_bg',
+        '_disable_bold',
+    )
+
+    _COLORS_KEYS = (
+        'DEFAULT',
+        'UNDERLINE',
+        'BOLD',
+        'SORT',
+        'OK',
+        'MAX',
+        'FILTER',
+        'TITLE',
+        'PROCESS',
+        'PROCESS_SELECTED',
+        'STATUS',
+        'NICE',
+        'CPU_TIME',
+        'CAREFUL',
+        'WARNING',
+        'CRITICAL',
+        'OK_LOG',
+        'CAREFUL_LOG',
+        'WARNING_LOG',
+        'CRITICAL_LOG',
+        'PASSWORD',
+        'SELECTED',
+        'INFO',
+        'ERROR',
+        'SEPARATOR',
+    )
+
     def __init__(self, args) -> None:
         self.args = args
 
+        # The disable flags never change for the life of the program:
+        # bind them once instead of going through args on each re-init
+        self._disable_bg = bool(args.disable_bg)
+        self._disable_bold = bool(args.disable_bold)
+
+        # Allocate the colors dict once; __build_colors_cache refreshes the
+        # values in place so callers can keep a reference on it
+        self._colors_cache = dict.fromkeys(self._COLORS_KEYS)
+        # Hand out a read-only view of the cache: it tracks the in-place
+        # updates but protects the cache from mutation by the callers
+        self._frozen_cache = MappingProxyType(self._colors_cache)
+
         # Define "home made" bold
-        self.A_BOLD = 0 if args.disable_bold else curses.A_BOLD
+        self.A_BOLD = 0 if self._disable_bold else curses.A_BOLD
 
         # Set defaults curses colors
         try:
-            if hasattr(curses, 'start_color'):
-                curses.start_color()
+            if _start_color is not None:
+                _start_color()
                 logger.debug(f'Curses interface compatible with {curses.COLORS} colors')
-            if hasattr(curses, 'use_default_colors'):
+            if _use_default_colors is not None:
                 # Use -1 to use the default foregound/background color
-                curses.use_default_colors()
-            if hasattr(curses, 'assume_default_colors'):
+                _use_default_colors()
+            if _assume_default_colors is not None:
                 # Define the color index 0 with -1 and -1 for foregound/background
                 # = curses.init_pair(0, -1, -1)
-                curses.assume_default_colors(-1, -1)
+                _assume_default_colors(-1, -1)
         except Exception as e:
             logger.warning(f'Error initializing terminal color ({e})')
 
@@ -56,60 +144,80 @@ class GlancesColors:
             # ex: export TERM=xterm-mono
             self.__define_bw()
 
-    def __repr__(self) -> dict:
-        return self.get()
+    def __repr__(self) -> str:
+        return f"<GlancesColors with {getattr(curses, 'COLORS', 0)} colors>"
 
     def __define_colors(self) -> None:
-        curses.init_pair(1, -1, -1)
-        if self.args.disable_bg:
-            curses.init_pair(2, curses.COLOR_RED, -1)
-            curses.init_pair(3, curses.COLOR_GREEN, -1)
-            curses.init_pair(5, curses.COLOR_MAGENTA, -1)
+        # Bind the curses functions to locals: LOAD_FAST is cheaper than
+        # the module attribute lookup repeated on every line below
+        init_pair = curses.init_pair
+        color_pair = curses.color_pair
+        a_bold = self.A_BOLD
+
+        # Table of (index, foreground, background) color pairs to register
+        if self._disable_bg:
+            pairs = (
+                (2, _RED, -1),
+                (3, _GREEN, -1),
+                (5, _MAGENTA, -1),
+            )
         else:
-            curses.init_pair(2, -1, curses.COLOR_RED)
-            curses.init_pair(3, curses.COLOR_BLACK, curses.COLOR_GREEN)
-            curses.init_pair(5, -1, curses.COLOR_MAGENTA)
-        curses.init_pair(4, curses.COLOR_BLUE, -1)
-        curses.init_pair(6, curses.COLOR_RED, -1)
-        curses.init_pair(7, curses.COLOR_GREEN, -1)
-        curses.init_pair(8, curses.COLOR_MAGENTA, -1)
+            pairs = (
+                (2, -1, _RED),
+                (3, _BLACK, _GREEN),
+                (5, -1, _MAGENTA),
+            )
+        pairs += (
+            (1, -1, -1),
+            (4, _BLUE, -1),
+            (6, _RED, -1),
+            (7, _GREEN, -1),
+            (8, _MAGENTA, -1),
+        )
+        for index, fg, bg in pairs:
+            init_pair(index, fg, bg)
 
         # Colors text styles
-        self.DEFAULT = curses.color_pair(1)
-        self.OK_LOG = curses.color_pair(3) | self.A_BOLD
-        self.NICE = curses.color_pair(8)
-        self.CPU_TIME = curses.color_pair(8)
-        self.CAREFUL_LOG = curses.color_pair(4) | self.A_BOLD
-        self.WARNING_LOG = curses.color_pair(5) | self.A_BOLD
-        self.CRITICAL_LOG = curses.color_pair(2) | self.A_BOLD
-        self.OK = curses.color_pair(7)
-        self.CAREFUL = curses.color_pair(4)
-        self.WARNING = curses.color_pair(8) | self.A_BOLD
-        self.CRITICAL = curses.color_pair(6) | self.A_BOLD
-        self.INFO = curses.color_pair(4)
-        self.FILTER = self.A_BOLD
-        self.SELECTED = self.A_BOLD
-        self.SEPARATOR = curses.color_pair(1)
+        # Pairs 1, 4 and 8 back several styles each: resolve them once
+        cp1 = color_pair(1)
+        cp4 = color_pair(4)
+        cp8 = color_pair(8)
+        self.DEFAULT = cp1
+        self.OK_LOG = color_pair(3) | a_bold
+        self.NICE = cp8
+        self.CPU_TIME = cp8
+        self.CAREFUL_LOG = cp4 | a_bold
+        self.WARNING_LOG = color_pair(5) | a_bold
+        self.CRITICAL_LOG = color_pair(2) | a_bold
+        self.OK = color_pair(7)
+        self.CAREFUL = cp4
+        self.WARNING = cp8 | a_bold
+        self.CRITICAL = color_pair(6) | a_bold
+        self.INFO = cp4
+        self.FILTER = a_bold
+        self.SELECTED = a_bold
+        self.SEPARATOR = cp1
 
         if curses.COLORS > 8:
             # ex: export TERM=xterm-256color
             try:
-                curses.init_pair(9, curses.COLOR_CYAN, -1)
-                curses.init_pair(10, curses.COLOR_YELLOW, -1)
+                init_pair(9, _CYAN, -1)
+                init_pair(10, _YELLOW, -1)
             except Exception:
-                curses.init_pair(9, -1, -1)
-                curses.init_pair(10, -1, -1)
-            self.FILTER = curses.color_pair(9) | self.A_BOLD
-            self.SELECTED = curses.color_pair(10) | self.A_BOLD
+                init_pair(9, -1, -1)
+                init_pair(10, -1, -1)
+            self.FILTER = color_pair(9) | a_bold
+            self.SELECTED = color_pair(10) | a_bold
 
             # Define separator line style
-            try:
+            # Skipped when the terminal cannot redefine colors (ex: TMUX),
+            # where init_color would only raise an exception to be caught
+            if curses.can_change_color():
                 curses.init_color(11, 500, 500, 500)
-                curses.init_pair(11, curses.COLOR_BLACK, -1)
-                self.SEPARATOR = curses.color_pair(11)
-            except Exception:
-                # Catch exception in TMUX
-                pass
+                init_pair(11, _BLACK, -1)
+                self.SEPARATOR = color_pair(11)
+
+        self.__build_colors_cache()
 
     def __define_bw(self) -> None:
         # The screen is NOT compatible with a colored design
@@ -120,42 +228,56 @@ class GlancesColors:
         self.NICE = self.A_BOLD
         self.CPU_TIME = self.A_BOLD
         self.CAREFUL_LOG = self.A_BOLD
-        self.WARNING_LOG = curses.A_UNDERLINE
-        self.CRITICAL_LOG = curses.A_REVERSE
+        self.WARNING_LOG = _A_UNDERLINE
+        self.CRITICAL_LOG = _A_REVERSE
         self.OK = -1
         self.CAREFUL = self.A_BOLD
-        self.WARNING = curses.A_UNDERLINE
-        self.CRITICAL = curses.A_REVERSE
+        self.WARNING = _A_UNDERLINE
+        self.CRITICAL = _A_REVERSE
         self.INFO = self.A_BOLD
         self.FILTER = self.A_BOLD
         self.SELECTED = self.A_BOLD
         self.SEPARATOR = -1
 
-    def get(self) -> dict:
-        return {
-            'DEFAULT': self.DEFAULT,
-            'UNDERLINE': curses.A_UNDERLINE,
-            'BOLD': self.A_BOLD,
-            'SORT': curses.A_UNDERLINE | self.A_BOLD,
-            'OK': self.OK,
-            'MAX': self.OK | self.A_BOLD,
-            'FILTER': self.FILTER,
-            'TITLE': self.A_BOLD,
-            'PROCESS': self.OK,
-            'PROCESS_SELECTED': self.OK | curses.A_UNDERLINE,
-            'STATUS': self.OK,
-            'NICE': self.NICE,
-            'CPU_TIME': self.CPU_TIME,
-            'CAREFUL': self.CAREFUL,
-            'WARNING': self.WARNING,
-            'CRITICAL': self.CRITICAL,
-            'OK_LOG': self.OK_LOG,
-            'CAREFUL_LOG': self.CAREFUL_LOG,
-            'WARNING_LOG': self.WARNING_LOG,
-            'CRITICAL_LOG': self.CRITICAL_LOG,
-            'PASSWORD': curses.A_PROTECT,
-            'SELECTED': self.SELECTED,
-            'INFO': self.INFO,
-            'ERROR': self.SELECTED,
-            'SEPARATOR': self.SEPARATOR,
-        }
+        self.__build_colors_cache()
+
+    def __build_colors_cache(self) -> None:
+        # Refresh the colors dict in place: the text styles only change when
+        # the color definitions are (re)computed, so get() can return it by
+        # reference instead of rebuilding it on every call
+        a_underline = _A_UNDERLINE
+
+        # Combined text styles, derived once from the base ones
+        self.SORT = a_underline | self.A_BOLD
+        self.MAX = self.OK | self.A_BOLD
+        self.PROCESS_SELECTED = self.OK | a_underline
+
+        cache = self._colors_cache
+        cache['DEFAULT'] = self.DEFAULT
+        cache['UNDERLINE'] = a_underline
+        cache['BOLD'] = self.A_BOLD
+        cache['SORT'] = self.SORT
+        cache['OK'] = self.OK
+        cache['MAX'] = self.MAX
+        cache['FILTER'] = self.FILTER
+        cache['TITLE'] = self.A_BOLD
+        cache['PROCESS'] = self.OK
+        cache['PROCESS_SELECTED'] = self.PROCESS_SELECTED
+        cache['STATUS'] = self.OK
+        cache['NICE'] = self.NICE
+        cache['CPU_TIME'] = self.CPU_TIME
+        cache['CAREFUL'] = self.CAREFUL
+        cache['WARNING'] = self.WARNING
+        cache['CRITICAL'] = self.CRITICAL
+        cache['OK_LOG'] = self.OK_LOG
+        cache['CAREFUL_LOG'] = self.CAREFUL_LOG
+        cache['WARNING_LOG'] = self.WARNING_LOG
+        cache['CRITICAL_LOG'] = self.CRITICAL_LOG
+        cache['PASSWORD'] = _A_PROTECT
+        cache['SELECTED'] = self.SELECTED
+        cache['INFO'] = self.INFO
+        cache['ERROR'] = self.SELECTED
+        cache['SEPARATOR'] = self.SEPARATOR
+
+    def get(self) -> MappingProxyType:
+        return self._frozen_cache
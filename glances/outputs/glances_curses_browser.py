@@ -30,6 +30,8 @@ class GlancesCursesBrowser(_GlancesCurses):
             'OFFLINE': self.colors_list['CRITICAL'],
             'PROTECTED': self.colors_list['WARNING'],
         }
+        # colors_list is a read-only view: extend it in a local copy
+        self.colors_list = dict(self.colors_list)
         self.colors_list.update(_colors_list)
 
         # First time scan tag